@@ -0,0 +1,211 @@
+# Time-bucketed donation analytics
+#
+# Rollups are updated as transactions are appended, so time-based queries
+# never have to re-parse the ISO timestamps stored in transaction_history.
+import heapq
+import math
+import threading
+from datetime import datetime, timezone
+
+# Buckets are aligned to and labelled in UTC.
+# Bucket width in seconds and how many buckets of each granularity we keep
+GRANULARITIES = {
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400
+}
+
+RETENTION = {
+    'minute': 24 * 60,       # 1 day of minutes
+    'hour': 30 * 24,         # 30 days of hours
+    'day': 3 * 365           # ~3 years of days
+}
+
+# Rolling windows, computed from hour buckets
+WINDOWS = {
+    '24h': 24,
+    '7d': 7 * 24
+}
+
+MAX_POINTS = 2000
+
+# Accepted epoch range for query bounds
+MAX_TIMESTAMP = datetime(9999, 12, 31, tzinfo=timezone.utc).timestamp()
+
+METRICS = ['deposit_volume', 'donation_volume', 'donation_count', 'requests_fulfilled']
+
+
+def _new_bucket():
+    return {
+        'deposit_volume': 0.0,
+        'donation_volume': 0.0,
+        'donation_count': 0,
+        'requests_fulfilled': 0,
+        'donors': set()
+    }
+
+
+def parse_time(value):
+    """Parse an ISO datetime or epoch seconds into epoch seconds.
+
+    ISO values without an offset are read as UTC, like the bucket labels.
+    """
+    if value is None or value == '':
+        return None
+    try:
+        ts = float(value)
+    except (ValueError, TypeError):
+        try:
+            parsed = datetime.fromisoformat(value)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            ts = parsed.timestamp()
+        except (ValueError, TypeError, OverflowError, OSError):
+            raise ValueError(f'Invalid time value: {value}')
+    if not math.isfinite(ts) or not 0 <= ts <= MAX_TIMESTAMP:
+        raise ValueError(f'Time value out of range: {value}')
+    return ts
+
+
+def format_bucket(start):
+    """ISO label of a bucket start, in UTC"""
+    return datetime.fromtimestamp(start, timezone.utc).isoformat()
+
+
+class DonationRollup:
+    """Per-minute/hour/day buckets of platform activity"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # granularity -> {bucket_start_epoch: bucket}
+        self._buckets = {name: {} for name in GRANULARITIES}
+        # granularity -> min-heap of bucket starts, for pruning out-of-order inserts
+        self._starts = {name: [] for name in GRANULARITIES}
+        # granularity -> newest bucket start seen so far
+        self._newest = {name: None for name in GRANULARITIES}
+        # Lifetime totals, independent of bucket retention
+        self._totals = {metric: 0 for metric in METRICS}
+
+    def _bucket_start(self, granularity, ts):
+        width = GRANULARITIES[granularity]
+        return int(ts // width) * width
+
+    def _cutoff(self, granularity):
+        """Bucket starts at or before this are outside retention"""
+        newest = self._newest[granularity]
+        if newest is None:
+            return None
+        return newest - RETENTION[granularity] * GRANULARITIES[granularity]
+
+    def _buckets_for(self, ts):
+        """Yield the bucket for ts in every granularity still retaining it"""
+        for name in GRANULARITIES:
+            series = self._buckets[name]
+            start = self._bucket_start(name, ts)
+            bucket = series.get(start)
+            if bucket is None:
+                cutoff = self._cutoff(name)
+                if cutoff is not None and start <= cutoff:
+                    continue  # Too old for this granularity
+                bucket = series[start] = _new_bucket()
+                heapq.heappush(self._starts[name], start)
+                if self._newest[name] is None or start > self._newest[name]:
+                    self._newest[name] = start
+                    self._prune(name)
+            yield bucket
+
+    def _prune(self, granularity):
+        series = self._buckets[granularity]
+        starts = self._starts[granularity]
+        cutoff = self._cutoff(granularity)
+        while starts and starts[0] <= cutoff:
+            del series[heapq.heappop(starts)]
+
+    def record_deposit(self, ts, amount):
+        with self._lock:
+            self._totals['deposit_volume'] += amount
+            for bucket in self._buckets_for(ts):
+                bucket['deposit_volume'] += amount
+
+    def record_donation(self, ts, donor_id, amount, fulfilled=False):
+        with self._lock:
+            self._totals['donation_volume'] += amount
+            self._totals['donation_count'] += 1
+            if fulfilled:
+                self._totals['requests_fulfilled'] += 1
+            for bucket in self._buckets_for(ts):
+                bucket['donation_volume'] += amount
+                bucket['donation_count'] += 1
+                bucket['donors'].add(donor_id)
+                if fulfilled:
+                    bucket['requests_fulfilled'] += 1
+
+    def record_transaction(self, user_id, transaction, ts=None, fulfilled=False):
+        """Feed a transaction_history entry into the rollups"""
+        if ts is None:
+            ts = datetime.fromisoformat(transaction['timestamp']).timestamp()
+        if transaction['type'] == 'deposit':
+            self.record_deposit(ts, transaction['amount'])
+        elif transaction['type'] == 'payment':
+            self.record_donation(ts, user_id, transaction['amount'], fulfilled)
+
+    def lifetime_totals(self):
+        with self._lock:
+            return dict(self._totals)
+
+    def _summarize(self, buckets):
+        totals = {metric: 0 for metric in METRICS}
+        donors = set()
+        for bucket in buckets:
+            for metric in METRICS:
+                totals[metric] += bucket[metric]
+            donors |= bucket['donors']
+        totals['unique_donors'] = len(donors)
+        return totals
+
+    def timeseries(self, granularity, start, end):
+        """Dense list of buckets covering [start, end]"""
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'Invalid granularity: {granularity}')
+
+        width = GRANULARITIES[granularity]
+        first = self._bucket_start(granularity, start)
+        last = self._bucket_start(granularity, end)
+        if last < first:
+            raise ValueError('"from" must be before "to"')
+        if (last - first) // width + 1 > MAX_POINTS:
+            raise ValueError(f'Range too large, at most {MAX_POINTS} {granularity} buckets')
+
+        points = []
+        with self._lock:
+            series = self._buckets[granularity]
+            for bucket_start in range(first, last + 1, width):
+                bucket = series.get(bucket_start)
+                point = self._summarize([bucket] if bucket else [])
+                point['bucket_start'] = format_bucket(bucket_start)
+                points.append(point)
+        return points
+
+    def rolling_windows(self, now=None):
+        """Totals for each rolling window, summed over hour buckets"""
+        if now is None:
+            now = datetime.now().timestamp()
+        width = GRANULARITIES['hour']
+        current = self._bucket_start('hour', now)
+
+        windows = {}
+        with self._lock:
+            series = self._buckets['hour']
+            for name, hours in WINDOWS.items():
+                buckets = []
+                for i in range(hours):
+                    bucket = series.get(current - i * width)
+                    if bucket:
+                        buckets.append(bucket)
+                windows[name] = self._summarize(buckets)
+        return windows
+
+
+def default_start(granularity, end, points=60):
+    """Default "from" for a timeseries query: `points` buckets before `end`"""
+    return end - GRANULARITIES[granularity] * (points - 1)
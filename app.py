@@ -1,15 +1,21 @@
-from flask import Flask, request, jsonify, session, send_from_directory
-from flask_cors import CORS
+from flask import Blueprint, Flask, current_app, request, jsonify, session, send_from_directory
 from datetime import datetime
 import uuid
 from functools import wraps
 import heapq
-from collections import defaultdict
+from collections import defaultdict, deque
 import os
+import threading
+import time
 
-app = Flask(__name__, static_folder='frontend', static_url_path='')
-app.secret_key = 'egyptian-donation-platform-secret-key-2025'
-CORS(app, supports_credentials=True, origins=["http://localhost:5000", "http://127.0.0.1:5000"])
+from analytics import DonationRollup, GRANULARITIES, parse_time, default_start
+import rate_limit as rate_limiting
+from rate_limit import rate_limit, init_load_shedding
+from json_provider import FastJSONProvider, FragmentCache, spliced_response
+from archive import RequestArchive
+from config import config
+
+bp = Blueprint('platform', __name__)
 
 # In-memory storage (will be replaced with database later)
 users = {}
@@ -18,6 +24,21 @@ approved_requests = {}
 pending_requests = []  # Priority queue implementation
 transaction_history = defaultdict(list)
 request_id_counter = 1
+rollup = DonationRollup()  # Time-bucketed analytics, fed by record_transaction()
+# Every request ever created (hot or archived), and how many are still pending
+request_totals = {'count': 0, 'amount': 0, 'pending': 0}
+request_totals_lock = threading.Lock()
+moderation_lock = threading.Lock()  # Serializes changes to pending_requests/approved_requests
+
+# Pre-encoded JSON fragments for hot, rarely-changing objects
+request_cards = FragmentCache()
+
+# Closed (fulfilled/declined) requests in the order they closed, as
+# (closed_at_epoch, request_id). Old ones are moved to request_archive.
+closed_requests = deque()
+request_archive = RequestArchive()
+archive_lock = threading.Lock()
+next_archive_run = 0
 
 # User types
 USER_TYPES = {
@@ -27,6 +48,10 @@ USER_TYPES = {
     'STAFF': 'Staff'
 }
 
+PRIORITY_LEVELS = [1, 2, 3]
+
+MODERATION_ACTIONS = ['approve', 'decline', 'set_priority']
+
 # Rank system
 RANKS = {
     0: 'Hope Giver',
@@ -74,6 +99,158 @@ def validate_amount(amount_str):
     except (ValueError, TypeError):
         return None, "Invalid amount format"
 
+def record_transaction(user_id, transaction, fulfilled=False):
+    """Append to transaction history and update the analytics rollups"""
+    transaction_history[user_id].append(transaction)
+    rollup.record_transaction(user_id, transaction, fulfilled=fulfilled)
+
+def add_request(req):
+    """Store a new request and count it in the running totals"""
+    donation_requests[req['id']] = req
+    with request_totals_lock:
+        request_totals['count'] += 1
+        request_totals['amount'] += req['amount']
+        if req['status'] == 'pending':
+            request_totals['pending'] += 1
+
+def close_request(req, status):
+    """Mark a request fulfilled/declined and queue it for archival"""
+    now = datetime.now()
+    req['status'] = status
+    req[f'{status}_at'] = now.isoformat()
+    closed_requests.append((now.timestamp(), req['id']))
+
+def archive_closed_requests(max_age_seconds, now=None):
+    """Move requests closed more than max_age_seconds ago into the archive"""
+    if now is None:
+        now = time.time()
+    cutoff = now - max_age_seconds
+    archived = 0
+    while closed_requests and closed_requests[0][0] <= cutoff:
+        _, request_id = closed_requests.popleft()
+        req = donation_requests.pop(request_id, None)
+        if req is not None:
+            request_archive.append(req)
+            archived += 1
+    return archived
+
+def find_request(request_id):
+    """Look a request up in the hot store, then in the archive"""
+    return donation_requests.get(request_id) or request_archive.get(request_id)
+
+def apply_moderation(actions, moderator_id):
+    """Apply a batch of moderation actions in one pass.
+    
+    The pending heap is rebuilt at most once for the whole batch. Returns
+    one outcome per action, in order. The whole pass runs under
+    moderation_lock so concurrent batches cannot lose each other's updates.
+    """
+    with moderation_lock:
+        return _apply_moderation(actions, moderator_id)
+
+def _apply_moderation(actions, moderator_id):
+    results = []
+    removed = set()  # Request ids no longer pending
+    reprioritized = {}  # Pending request id -> new priority
+    now = datetime.now().isoformat()
+    
+    for item in actions:
+        request_id = str(item.get('id', '')) if isinstance(item, dict) else ''
+        action = item.get('action') if isinstance(item, dict) else None
+        result = {'id': request_id, 'action': action, 'success': False}
+        results.append(result)
+        
+        if action not in MODERATION_ACTIONS:
+            result['error'] = 'Invalid action'
+            continue
+        
+        req = donation_requests.get(request_id)
+        if not req:
+            result['error'] = 'Request not found'
+            continue
+        
+        if action == 'set_priority':
+            priority = item.get('priority_level')
+            # bool is an int subclass and 1.0 == 1, so check the exact type
+            if type(priority) is not int or priority not in PRIORITY_LEVELS:
+                result['error'] = f'Priority level must be one of: {", ".join(map(str, PRIORITY_LEVELS))}'
+                continue
+            if req['status'] not in ['pending', 'approved']:
+                result['error'] = f'Request is {req["status"]}'
+                continue
+            req['priority_level'] = priority
+            if req['status'] == 'pending':
+                reprioritized[request_id] = priority
+        else:
+            if req['status'] != 'pending':
+                result['error'] = f'Request is {req["status"]}'
+                continue
+            if action == 'approve':
+                req['approved'] = True
+                req['status'] = 'approved'
+                req['approved_at'] = now
+                req['approved_by'] = moderator_id
+                approved_requests[request_id] = req
+            else:
+                req['declined_by'] = moderator_id
+                close_request(req, 'declined')
+            removed.add(request_id)
+            with request_totals_lock:
+                request_totals['pending'] -= 1
+        
+        result['success'] = True
+        result['status'] = req['status']
+        result['priority_level'] = req['priority_level']
+    
+    # Single heap rebuild for the whole batch
+    if removed or reprioritized:
+        pending_requests[:] = [
+            (reprioritized.get(request_id, priority), ts, request_id)
+            for priority, ts, request_id in pending_requests
+            if request_id not in removed
+        ]
+        heapq.heapify(pending_requests)
+    
+    return results
+
+def public_request_card(req):
+    """Public view of an approved request"""
+    return {
+        'id': req['id'],
+        'recipient_username': req['recipient_username'],
+        'amount': req['amount'],
+        'remaining_amount': req['remaining_amount'],
+        'priority_level': req['priority_level'],
+        'reason': req['reason'],
+        'case_details': req['case_details'],
+        'created_at': req['created_at'],
+        'progress_percentage': ((req['amount'] - req['remaining_amount']) / req['amount']) * 100
+    }
+
+def request_card_fragment(req):
+    """Encoded public card, re-encoded only when its mutable fields change"""
+    version = (req['remaining_amount'], req['priority_level'])
+    return request_cards.get(req['id'], version, lambda: public_request_card(req))
+
+def user_profile(user):
+    """Profile block returned by /api/auth/profile"""
+    profile = {
+        'id': user['id'],
+        'username': user['username'],
+        'type': user['type'],
+        'rank': user['rank'],
+        'paid_requests': user['paid_requests'],
+        'is_staff': user.get('is_staff', False),
+        'staff_invite_pending': user.get('staff_invite_pending', False),
+        'staff_invite_message': user.get('staff_invite_message', ''),
+        'created_at': user['created_at']
+    }
+    
+    if user['type'] == USER_TYPES['DONOR']:
+        profile['balance'] = user.get('balance', 0.0)
+    
+    return profile
+
 def validate_visa_number(visa):
     """Validate Visa card number"""
     if len(visa) != 16 or not visa.isdigit():
@@ -81,11 +258,11 @@ def validate_visa_number(visa):
     return True, None
 
 # Serve frontend
-@app.route('/')
+@bp.route('/')
 def serve_frontend():
     return send_from_directory('frontend', 'index.html')
 
-@app.route('/<path:path>')
+@bp.route('/<path:path>')
 def serve_static(path):
     try:
         return send_from_directory('frontend', path)
@@ -93,7 +270,8 @@ def serve_static(path):
         return send_from_directory('frontend', 'index.html')
 
 # Authentication Routes
-@app.route('/api/auth/login', methods=['POST'])
+@bp.route('/api/auth/login', methods=['POST'])
+@rate_limit(10, per=60, scope='ip')
 def login():
     try:
         data = request.get_json()
@@ -144,7 +322,8 @@ def login():
         print(f"Login error: {str(e)}")
         return jsonify({'error': 'Server error during login'}), 500
 
-@app.route('/api/auth/register', methods=['POST'])
+@bp.route('/api/auth/register', methods=['POST'])
+@rate_limit(5, per=60, scope='ip')
 def register():
     try:
         data = request.get_json()
@@ -196,12 +375,12 @@ def register():
         print(f"Registration error: {str(e)}")
         return jsonify({'error': 'Server error during registration'}), 500
 
-@app.route('/api/auth/logout', methods=['POST'])
+@bp.route('/api/auth/logout', methods=['POST'])
 def logout():
     session.clear()
     return jsonify({'success': True, 'message': 'Logout successful'})
 
-@app.route('/api/auth/profile', methods=['GET'])
+@bp.route('/api/auth/profile', methods=['GET'])
 @require_auth
 def get_profile():
     try:
@@ -209,29 +388,15 @@ def get_profile():
         if not user:
             return jsonify({'error': 'User not found'}), 404
         
-        profile = {
-            'id': user['id'],
-            'username': user['username'],
-            'type': user['type'],
-            'rank': user['rank'],
-            'paid_requests': user['paid_requests'],
-            'is_staff': user.get('is_staff', False),
-            'staff_invite_pending': user.get('staff_invite_pending', False),
-            'staff_invite_message': user.get('staff_invite_message', ''),
-            'created_at': user['created_at']
-        }
-        
-        if user['type'] == USER_TYPES['DONOR']:
-            profile['balance'] = user.get('balance', 0.0)
-        
-        return jsonify({'success': True, 'user': profile})
+        return jsonify({'success': True, 'user': user_profile(user)})
         
     except Exception as e:
         print(f"Profile error: {str(e)}")
         return jsonify({'error': 'Server error'}), 500
 
 # Donor Routes
-@app.route('/api/donor/balance', methods=['POST'])
+@bp.route('/api/donor/balance', methods=['POST'])
+@rate_limit(20, per=60, scope='user')
 @require_auth
 def add_balance():
     try:
@@ -256,7 +421,7 @@ def add_balance():
         user['balance'] = user.get('balance', 0) + amount
         
         # Add transaction history
-        transaction_history[user['id']].append({
+        record_transaction(user['id'], {
             'type': 'deposit',
             'amount': amount,
             'description': f'Balance deposit: ${amount:.2f}',
@@ -274,7 +439,7 @@ def add_balance():
         print(f"Add balance error: {str(e)}")
         return jsonify({'error': 'Server error'}), 500
 
-@app.route('/api/donor/balance', methods=['GET'])
+@bp.route('/api/donor/balance', methods=['GET'])
 @require_auth
 def get_balance():
     try:
@@ -291,7 +456,7 @@ def get_balance():
         print(f"Get balance error: {str(e)}")
         return jsonify({'error': 'Server error'}), 500
 
-@app.route('/api/donor/transactions', methods=['GET'])
+@bp.route('/api/donor/transactions', methods=['GET'])
 @require_auth
 def get_transaction_history():
     try:
@@ -309,7 +474,8 @@ def get_transaction_history():
         print(f"Get transactions error: {str(e)}")
         return jsonify({'error': 'Server error'}), 500
 
-@app.route('/api/donor/donate', methods=['POST'])
+@bp.route('/api/donor/donate', methods=['POST'])
+@rate_limit(30, per=60, scope='user')
 @require_auth
 def make_donation():
     try:
@@ -345,21 +511,23 @@ def make_donation():
         user['rank'] = get_user_rank(user['paid_requests'])
         
         donation_request['remaining_amount'] -= amount
+        fulfilled = donation_request['remaining_amount'] <= 0
         
         # Add transaction
-        transaction_history[user['id']].append({
+        record_transaction(user['id'], {
             'type': 'payment',
             'amount': amount,
             'description': f'Donation: ${amount:.2f} to {donation_request["reason"]}',
             'timestamp': datetime.now().isoformat(),
             'request_id': request_id,
             'recipient': donation_request['recipient_username']
-        })
+        }, fulfilled=fulfilled)
         
         # If fully paid, remove from approved requests
-        fulfilled = donation_request['remaining_amount'] <= 0
         if fulfilled:
             del approved_requests[request_id]
+            request_cards.discard(request_id)
+            close_request(donation_request, 'fulfilled')
         
         return jsonify({
             'success': True,
@@ -375,62 +543,137 @@ def make_donation():
         print(f"Donation error: {str(e)}")
         return jsonify({'error': 'Server error'}), 500
 
+# Recipient Routes
+@bp.route('/api/recipient/requests', methods=['GET'])
+@require_auth
+def get_recipient_requests():
+    try:
+        user = users.get(session['user_id'])
+        if not user or user['type'] != USER_TYPES['RECIPIENT']:
+            return jsonify({'error': 'Recipient access required'}), 403
+        
+        # Iterate over a copy: archival may remove entries concurrently
+        requests_list = [req for req in list(donation_requests.values()) if req['recipient_id'] == user['id']]
+        requests_list.extend(request_archive.for_recipient(user['id']))
+        requests_list.sort(key=lambda x: x['created_at'], reverse=True)
+        
+        return jsonify({
+            'success': True,
+            'requests': requests_list
+        })
+        
+    except Exception as e:
+        print(f"Get recipient requests error: {str(e)}")
+        return jsonify({'error': 'Server error'}), 500
+
+# Admin Routes
+@bp.route('/api/admin/requests/<request_id>', methods=['GET'])
+@require_admin
+def get_request_details(request_id):
+    try:
+        req = find_request(request_id)
+        if not req:
+            return jsonify({'error': 'Request not found'}), 404
+        
+        return jsonify({
+            'success': True,
+            'request': req,
+            'archived': request_id in request_archive
+        })
+        
+    except Exception as e:
+        print(f"Get request details error: {str(e)}")
+        return jsonify({'error': 'Server error'}), 500
+
+@bp.route('/api/admin/requests/bulk', methods=['POST'])
+@rate_limit(30, per=60, scope='user')
+@require_admin
+def bulk_moderate_requests():
+    try:
+        data = request.get_json()
+        if not data or not isinstance(data.get('actions'), list) or not data['actions']:
+            return jsonify({'error': 'A non-empty list of actions is required'}), 400
+        
+        max_actions = current_app.config['BULK_MODERATION_MAX_ACTIONS']
+        if len(data['actions']) > max_actions:
+            return jsonify({'error': f'At most {max_actions} actions per batch'}), 400
+        
+        results = apply_moderation(data['actions'], session['user_id'])
+        succeeded = sum(1 for r in results if r['success'])
+        
+        return jsonify({
+            'success': True,
+            'message': f'{succeeded} of {len(results)} actions applied',
+            'results': results
+        })
+        
+    except Exception as e:
+        print(f"Bulk moderation error: {str(e)}")
+        return jsonify({'error': 'Server error'}), 500
+
+@bp.route('/api/admin/requests/<request_id>/approve', methods=['POST'])
+@require_admin
+def approve_request(request_id):
+    return moderate_single_request(request_id, 'approve')
+
+@bp.route('/api/admin/requests/<request_id>/decline', methods=['POST'])
+@require_admin
+def decline_request(request_id):
+    return moderate_single_request(request_id, 'decline')
+
+def moderate_single_request(request_id, action):
+    try:
+        result = apply_moderation([{'id': request_id, 'action': action}], session['user_id'])[0]
+        if not result['success']:
+            status = 404 if result['error'] == 'Request not found' else 409
+            return jsonify({'error': result['error']}), status
+        
+        return jsonify({
+            'success': True,
+            'message': f'Request {request_id} {result["status"]}'
+        })
+        
+    except Exception as e:
+        print(f"Moderation error: {str(e)}")
+        return jsonify({'error': 'Server error'}), 500
+
 # Continue with other routes... (keeping them similar but adding proper error handling)
 # ... (rest of the routes with similar improvements)
 
 # Public Routes
-@app.route('/api/requests/approved', methods=['GET'])
+@bp.route('/api/requests/approved', methods=['GET'])
+@rate_limit(120, per=60, scope='ip')
 def get_public_approved_requests():
     try:
-        requests_list = []
-        for req in approved_requests.values():
-            requests_list.append({
-                'id': req['id'],
-                'recipient_username': req['recipient_username'],
-                'amount': req['amount'],
-                'remaining_amount': req['remaining_amount'],
-                'priority_level': req['priority_level'],
-                'reason': req['reason'],
-                'case_details': req['case_details'],
-                'created_at': req['created_at'],
-                'progress_percentage': ((req['amount'] - req['remaining_amount']) / req['amount']) * 100
-            })
-        
         # Sort by priority and creation date
-        requests_list.sort(key=lambda x: (x['priority_level'], x['created_at']))
+        ordered = sorted(approved_requests.values(), key=lambda r: (r['priority_level'], r['created_at']))
+        cards = [request_card_fragment(req) for req in ordered]
         
-        return jsonify({
-            'success': True,
-            'requests': requests_list
-        })
+        return spliced_response({'success': True}, {'requests': cards})
         
     except Exception as e:
         print(f"Get approved requests error: {str(e)}")
         return jsonify({'error': 'Server error'}), 500
 
-@app.route('/api/stats', methods=['GET'])
+@bp.route('/api/stats', methods=['GET'])
+@rate_limit(60, per=60, scope='ip')
 def get_platform_stats():
     try:
-        total_donated = 0
-        total_requests_amount = 0
-        
-        # Calculate total donated
-        for transactions in transaction_history.values():
-            for transaction in transactions:
-                if transaction['type'] == 'payment':
-                    total_donated += transaction['amount']
-        
-        # Calculate total requests amount
-        for req in list(donation_requests.values()) + list(approved_requests.values()):
-            total_requests_amount += req['amount']
+        # Running totals, so cost does not grow with history
+        total_donated = rollup.lifetime_totals()['donation_volume']
+        with request_totals_lock:
+            total_requests = request_totals['count']
+            total_requests_amount = request_totals['amount']
+            pending_count = request_totals['pending']
         
         stats = {
             'total_users': len(users),
             'total_donors': len([u for u in users.values() if u['type'] in ['Donor', 'Staff']]),
             'total_recipients': len([u for u in users.values() if u['type'] == 'Recipient']),
-            'pending_requests': len([req for req in donation_requests.values() if not req.get('approved', False)]),
+            'pending_requests': pending_count,
             'approved_requests': len(approved_requests),
-            'total_requests': len(donation_requests),
+            'total_requests': total_requests,
+            'archived_requests': len(request_archive),
             'total_donated': total_donated,
             'total_requests_amount': total_requests_amount,
             'platform_efficiency': (total_donated / total_requests_amount * 100) if total_requests_amount > 0 else 0
@@ -445,13 +688,45 @@ def get_platform_stats():
         print(f"Get stats error: {str(e)}")
         return jsonify({'error': 'Server error'}), 500
 
+@bp.route('/api/stats/timeseries', methods=['GET'])
+@rate_limit(30, per=60, scope='ip')
+def get_stats_timeseries():
+    try:
+        granularity = request.args.get('granularity', 'hour')
+        if granularity not in GRANULARITIES:
+            return jsonify({'error': f'Granularity must be one of: {", ".join(GRANULARITIES)}'}), 400
+        
+        try:
+            end = parse_time(request.args.get('to'))
+            if end is None:
+                end = datetime.now().timestamp()
+            start = parse_time(request.args.get('from'))
+            if start is None:
+                start = default_start(granularity, end)
+            points = rollup.timeseries(granularity, start, end)
+        except (OverflowError, OSError):
+            return jsonify({'error': 'Time range out of range'}), 400
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        return jsonify({
+            'success': True,
+            'granularity': granularity,
+            'timeseries': points,
+            'windows': rollup.rolling_windows()
+        })
+        
+    except Exception as e:
+        print(f"Get stats timeseries error: {str(e)}")
+        return jsonify({'error': 'Server error'}), 500
+
 # Initialize the application with better test data
-def init_admin():
+def init_admin(username='admin', password='1234'):
     admin_id = str(uuid.uuid4())
     users[admin_id] = {
         'id': admin_id,
-        'username': 'admin',
-        'password': '1234',
+        'username': username,
+        'password': password,
         'type': USER_TYPES['ADMIN'],
         'created_at': datetime.now().isoformat(),
         'paid_requests': 0,
@@ -497,7 +772,7 @@ def create_realistic_test_data():
         
         # Add some transaction history for each donor
         for i in range(min(5, donor_data['paid_requests'])):
-            transaction_history[user_id].append({
+            record_transaction(user_id, {
                 'type': 'deposit',
                 'amount': donor_data['balance'] / 5,
                 'description': f'Balance deposit: ${donor_data["balance"] / 5:.2f}',
@@ -640,31 +915,95 @@ def create_realistic_test_data():
                 'funded_amount': req_data['funded']
             }
             
-            donation_requests[request_id] = new_request
+            add_request(new_request)
             
             if req_data['approved']:
                 approved_requests[request_id] = new_request
             else:
                 heapq.heappush(pending_requests, (req_data['priority'], datetime.now().timestamp(), request_id))
 
+def seed_data(app):
+    """Create the admin account and, if configured, the demo data (once)"""
+    if users:
+        return
+    init_admin(app.config['ADMIN_USERNAME'], app.config['ADMIN_PASSWORD'])
+    if app.config['SEED_DEMO_DATA']:
+        create_realistic_test_data()
+
+def init_archival(app):
+    """Periodically archive old closed requests, piggybacking on incoming requests"""
+    request_archive.base_directory = app.config['ARCHIVE_DIR']
+    request_archive.segment_max_bytes = app.config['ARCHIVE_SEGMENT_MAX_BYTES']
+    
+    @app.before_request
+    def maybe_archive():
+        global next_archive_run
+        if time.monotonic() < next_archive_run or not archive_lock.acquire(blocking=False):
+            return
+        try:
+            next_archive_run = time.monotonic() + app.config['ARCHIVE_INTERVAL_SECONDS']
+            archive_closed_requests(app.config['ARCHIVE_AFTER_SECONDS'])
+        except Exception as e:
+            print(f"Archival error: {str(e)}")
+        finally:
+            archive_lock.release()
+
+def create_app(config_name=None):
+    """Application factory.
+    
+    Platform state (users, requests, rollups, rate-limit buckets and the
+    request archive) lives in module-level singletons, so it is shared by
+    every app created in this process, and the latest call's config applies
+    to the rate limiter and the archive. The singletons are exposed as
+    app.extensions['donation_platform'].
+    """
+    # Imported here so merely importing this module stays cheap
+    from flask_cors import CORS
+    
+    config_name = config_name or os.environ.get('FLASK_CONFIG', 'default')
+    if config_name not in config:
+        raise ValueError(f'Unknown config: {config_name}')
+    
+    app = Flask(__name__, static_folder='frontend', static_url_path='')
+    app.config.from_object(config[config_name])
+    if not app.config.get('SECRET_KEY'):
+        raise RuntimeError(f'SECRET_KEY must be set in the environment for the {config_name} config')
+    if not app.config.get('ADMIN_PASSWORD'):
+        raise RuntimeError(f'ADMIN_PASSWORD must be set in the environment for the {config_name} config')
+    app.json = FastJSONProvider(app)
+    CORS(app, supports_credentials=True, origins=app.config['CORS_ORIGINS'])
+    
+    rate_limiting.buckets.max_keys = app.config['RATE_LIMIT_MAX_KEYS']
+    init_load_shedding(app, max_concurrent=app.config['MAX_CONCURRENT_REQUESTS'])
+    init_archival(app)
+    
+    app.register_blueprint(bp)
+    app.extensions['donation_platform'] = {
+        'rate_limit_buckets': rate_limiting.buckets,
+        'request_archive': request_archive,
+        'rollup': rollup
+    }
+    seed_data(app)
+    return app
+
 if __name__ == '__main__':
-    init_admin()
-    create_realistic_test_data()
+    app = create_app()
     
     print("=" * 60)
     print("🇪🇬 EGYPTIAN NATIONAL DONATION PLATFORM")
     print("=" * 60)
     print("🚀 Server starting...")
-    print("📍 URL: http://localhost:5000")
+    print(f"📍 URL: http://localhost:{app.config['SERVER_PORT']}")
     print("📊 Platform loaded with realistic data:")
     print(f"   👥 Users: {len(users)}")
     print(f"   🎯 Active Requests: {len(approved_requests)}")
-    print(f"   ⏳ Pending Requests: {len([r for r in donation_requests.values() if not r.get('approved')])}")
+    print(f"   ⏳ Pending Requests: {request_totals['pending']}")
     print()
     print("🔑 Demo Accounts:")
-    print("   🔐 Admin: admin / 1234")
+    admin_password = app.config['ADMIN_PASSWORD'] if app.config['DEBUG'] else '(from ADMIN_PASSWORD)'
+    print(f"   🔐 Admin: {app.config['ADMIN_USERNAME']} / {admin_password}")
     print("   💰 Donor: ahmed_hassan / pass123")
     print("   🙏 Recipient: heart_surgery_child / help123")
     print("=" * 60)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    app.run(debug=app.config['DEBUG'], host=app.config['SERVER_HOST'], port=app.config['SERVER_PORT'])
\ No newline at end of file
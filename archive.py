@@ -0,0 +1,111 @@
+# Cold storage for closed (fulfilled/declined) donation requests
+#
+# Records are appended to size-capped NDJSON segment files. An in-memory
+# index maps each id to its (segment, offset, length), so a lookup is a
+# single seek and read. Platform stats come from running totals in app.py,
+# so they never read the segments back.
+#
+# Request ids restart with every run, so segments are never reloaded. Each
+# process writes to its own `requests-archive-<pid>` directory. It is deleted
+# by an atexit hook on normal interpreter exit; serve.py turns SIGTERM into a
+# normal exit and removes it explicitly in forked workers, which leave via
+# os._exit(). Directories left behind by processes that died without cleanup
+# (e.g. SIGKILL) are deleted when the next archive is opened in the same place.
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+DEFAULT_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+
+_DIRECTORY_PREFIX = 'requests-archive-'
+
+
+def _pid_running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _remove_stale_directories(base):
+    for name in os.listdir(base):
+        pid = name[len(_DIRECTORY_PREFIX):]
+        if not name.startswith(_DIRECTORY_PREFIX) or not pid.isdigit():
+            continue
+        if int(pid) != os.getpid() and _pid_running(int(pid)):
+            continue
+        shutil.rmtree(os.path.join(base, name), ignore_errors=True)
+
+
+class RequestArchive:
+    """Append-only on-disk archive of request records"""
+
+    def __init__(self, directory=None, segment_max_bytes=DEFAULT_SEGMENT_MAX_BYTES):
+        self.base_directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.directory = None  # Created on first write
+        self._lock = threading.Lock()
+        self._segment = 0
+        self._segment_size = 0
+        self._index = {}  # request_id -> (segment, offset, length)
+        self._by_recipient = {}  # recipient_id -> [request_id]
+
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, f'segment-{segment:05d}.ndjson')
+
+    def _open_directory(self):
+        base = self.base_directory or tempfile.gettempdir()
+        os.makedirs(base, exist_ok=True)
+        _remove_stale_directories(base)
+        self.directory = os.path.join(base, f'{_DIRECTORY_PREFIX}{os.getpid()}')
+        os.makedirs(self.directory)
+        atexit.register(self.remove)
+
+    def remove(self):
+        """Delete this process's segments"""
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def append(self, record):
+        """Archive a request record"""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+        with self._lock:
+            if self.directory is None:
+                self._open_directory()
+            if self._segment_size and self._segment_size + len(line) > self.segment_max_bytes:
+                self._segment += 1
+                self._segment_size = 0
+
+            with open(self._segment_path(self._segment), 'ab') as f:
+                f.write(line)
+
+            self._index[record['id']] = (self._segment, self._segment_size, len(line))
+            self._segment_size += len(line)
+            self._by_recipient.setdefault(record['recipient_id'], []).append(record['id'])
+
+    def get(self, request_id):
+        """Return the archived record for request_id, or None"""
+        location = self._index.get(request_id)
+        if location is None:
+            return None
+        segment, offset, length = location
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def for_recipient(self, recipient_id):
+        """All archived records of a recipient, oldest first"""
+        return [self.get(request_id) for request_id in self._by_recipient.get(recipient_id, [])]
+
+    def __contains__(self, request_id):
+        return request_id in self._index
+
+    def __len__(self):
+        return len(self._index)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# Micro-benchmark: stdlib jsonify vs fast provider with pre-encoded fragments
+import json
+import sys
+import timeit
+
+import app as platform
+from json_provider import BACKEND, encode, spliced_response
+
+ROUNDS = 200
+
+
+def seed(n_requests=500, n_transactions=500):
+    app = platform.create_app('development')
+
+    template = next(iter(platform.approved_requests.values()))
+    for i in range(n_requests):
+        request_id = f'bench-{i}'
+        platform.approved_requests[request_id] = dict(template, id=request_id, remaining_amount=1000 + i)
+
+    donor = next(u for u in platform.users.values() if u['type'] == 'Donor')
+    for i in range(n_transactions):
+        platform.transaction_history[donor['id']].append({
+            'type': 'deposit',
+            'amount': 100.0 + i,
+            'description': f'Balance deposit: ${100.0 + i:.2f}',
+            'timestamp': '2025-01-01T12:00:00',
+            'visa_last_4': '1234'
+        })
+    return app, donor
+
+
+def stdlib_body(obj):
+    # What the default provider does for jsonify()
+    return json.dumps(obj, separators=(',', ':'), sort_keys=True).encode('utf-8')
+
+
+def bench(app, name, baseline, fast):
+    with app.app_context():
+        fast()  # Warm the fragment caches
+        base_time = timeit.timeit(baseline, number=ROUNDS) / ROUNDS
+        fast_time = timeit.timeit(fast, number=ROUNDS) / ROUNDS
+    print(f'{name:<44} stdlib {base_time * 1e6:9.1f} us   fast {fast_time * 1e6:9.1f} us   '
+          f'x{base_time / fast_time:5.1f}')
+
+
+def main():
+    app, donor = seed()
+
+    def ordered_requests():
+        return sorted(platform.approved_requests.values(), key=lambda r: (r['priority_level'], r['created_at']))
+
+    bench(
+        app,
+        'GET /api/requests/approved',
+        lambda: stdlib_body({'success': True, 'requests': [platform.public_request_card(r) for r in ordered_requests()]}),
+        lambda: spliced_response({'success': True},
+                                 {'requests': [platform.request_card_fragment(r) for r in ordered_requests()]})
+    )
+
+    transactions = platform.transaction_history[donor['id']]
+    bench(
+        app,
+        'GET /api/donor/transactions (no fragments)',
+        lambda: stdlib_body({'success': True, 'transactions': list(reversed(transactions))}),
+        lambda: encode({'success': True, 'transactions': list(reversed(transactions))})
+    )
+
+    bench(
+        app,
+        'GET /api/auth/profile (no fragments)',
+        lambda: stdlib_body({'success': True, 'user': platform.user_profile(donor)}),
+        lambda: encode({'success': True, 'user': platform.user_profile(donor)})
+    )
+
+    stats = {'total_users': len(platform.users), 'total_donated': 12345.5, 'platform_efficiency': 42.0}
+    bench(
+        app,
+        'GET /api/stats (no fragments)',
+        lambda: stdlib_body({'success': True, 'stats': stats}),
+        lambda: encode({'success': True, 'stats': stats})
+    )
+
+
+if __name__ == '__main__':
+    print(f'JSON backend: {BACKEND} (Python {sys.version.split()[0]}), {ROUNDS} rounds')
+    main()
@@ -11,7 +11,41 @@ class Config:
     SESSION_COOKIE_SAMESITE = 'Lax'
     
     # CORS configuration
-    CORS_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000']
+    CORS_ORIGINS = ['http://localhost:5000', 'http://127.0.0.1:5000']
+    
+    # Admin account created on startup
+    ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME') or 'admin'
+    ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD') or '1234'
+    
+    # Seed the demo donors, recipients and requests on startup
+    SEED_DEMO_DATA = True
+    
+    # Rate limiting and load shedding
+    RATE_LIMIT_MAX_KEYS = 10000
+    # Requests in flight (running plus queued) per process before shedding with
+    # 503; serve.py requires this to be at least SERVER_THREADS
+    MAX_CONCURRENT_REQUESTS = 64
+    
+    # Admin bulk moderation
+    BULK_MODERATION_MAX_ACTIONS = 1000
+    
+    # Production launcher (serve.py)
+    SERVER_HOST = os.environ.get('HOST', '0.0.0.0')
+    SERVER_PORT = int(os.environ.get('PORT', 5000))
+    SERVER_THREADS = int(os.environ.get('SERVER_THREADS', 8))
+    SERVER_PROCESSES = int(os.environ.get('SERVER_PROCESSES', 1))
+    # Seconds a client may stay idle while sending a request
+    SERVER_REQUEST_TIMEOUT = int(os.environ.get('SERVER_REQUEST_TIMEOUT', 10))
+    COLD_START_BUDGET_MS = 1000
+    
+    # Archival of fulfilled/declined requests. Each process writes its own
+    # segments under ARCHIVE_DIR (default: the system temp dir). They are removed
+    # on exit (including SIGTERM under serve.py); leftovers from killed processes
+    # are removed by the next process that opens an archive there.
+    ARCHIVE_DIR = os.environ.get('ARCHIVE_DIR')
+    ARCHIVE_AFTER_SECONDS = 7 * 24 * 3600
+    ARCHIVE_INTERVAL_SECONDS = 60
+    ARCHIVE_SEGMENT_MAX_BYTES = 4 * 1024 * 1024
     
     # Future database configuration
     DATABASE_URL = os.environ.get('DATABASE_URL') or 'sqlite:///donation_platform.db'
@@ -22,6 +56,11 @@ class DevelopmentConfig(Config):
 class ProductionConfig(Config):
     DEBUG = False
     SESSION_COOKIE_SECURE = True
+    # No fallback: create_app refuses to start without SECRET_KEY set
+    SECRET_KEY = os.environ.get('SECRET_KEY')
+    # No demo admin: create_app refuses to start without ADMIN_PASSWORD set
+    ADMIN_PASSWORD = os.environ.get('ADMIN_PASSWORD')
+    SEED_DEMO_DATA = os.environ.get('SEED_DEMO_DATA') == '1'
 
 config = {
     'development': DevelopmentConfig,
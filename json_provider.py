@@ -0,0 +1,132 @@
+# Fast JSON serialization
+#
+# Uses orjson or ujson when installed and falls back to the stdlib. Hot,
+# rarely-changing objects are cached as pre-encoded fragments and spliced
+# into responses without being serialized again.
+import dataclasses
+import decimal
+import json
+import threading
+import uuid
+from datetime import date
+
+from flask import current_app
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _default(o):
+    """Encode the extra types Flask's default provider supports"""
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+
+if orjson is not None:
+    BACKEND = 'orjson'
+
+    def encode(obj):
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+
+    decode = orjson.loads
+elif ujson is not None:
+    BACKEND = 'ujson'
+
+    def encode(obj):
+        return ujson.dumps(obj, ensure_ascii=False, default=_default).encode('utf-8')
+
+    decode = ujson.loads
+else:
+    BACKEND = 'json'
+
+    def encode(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+    decode = json.loads
+
+
+class FastJSONProvider(JSONProvider):
+    """Flask JSON provider backed by the fastest available encoder"""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        # Options like indent or sort_keys are only honored by the stdlib
+        if kwargs:
+            kwargs.setdefault('default', _default)
+            return json.dumps(obj, **kwargs)
+        return encode(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return json.loads(s, **kwargs)
+        return decode(s)
+
+    def response(self, *args, **kwargs):
+        if args and kwargs:
+            raise TypeError('jsonify() behavior undefined when passed both args and kwargs')
+        if kwargs:
+            obj = kwargs
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = list(args) or None
+        return self._app.response_class(encode(obj) + b'\n', mimetype=self.mimetype)
+
+
+class FragmentCache:
+    """Pre-encoded JSON fragments, rebuilt only when their version changes"""
+
+    def __init__(self):
+        self._fragments = {}  # key -> (version, bytes)
+        self._lock = threading.Lock()
+
+    def get(self, key, version, build):
+        """Return the fragment for key, calling build() to re-encode if stale"""
+        cached = self._fragments.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        fragment = encode(build())
+        with self._lock:
+            self._fragments[key] = (version, fragment)
+        return fragment
+
+    def discard(self, key):
+        with self._lock:
+            self._fragments.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+
+
+def spliced_response(fields, fragments):
+    """JSON object response made of plain `fields` and pre-encoded `fragments`.
+
+    Each fragment value is either encoded bytes or a list of encoded bytes.
+    """
+    parts = []
+    for key, value in fields.items():
+        parts.append(encode(key) + b':' + encode(value))
+    for key, value in fragments.items():
+        if isinstance(value, list):
+            value = b'[' + b','.join(value) + b']'
+        parts.append(encode(key) + b':' + value)
+    body = b'{' + b','.join(parts) + b'}\n'
+    return current_app.response_class(body, mimetype='application/json')
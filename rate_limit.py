@@ -0,0 +1,118 @@
+# In-process rate limiting and load shedding
+#
+# Token buckets live in a bounded LRU table, so memory stays flat no matter
+# how many clients we see. Rejections are pre-encoded responses and never
+# touch the route handler.
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import Response, g, request, session
+
+DEFAULT_MAX_KEYS = 10000
+DEFAULT_MAX_CONCURRENT = 64
+
+_TOO_MANY_REQUESTS = b'{"error": "Too many requests"}\n'
+_SERVER_BUSY = b'{"error": "Server busy, try again shortly"}\n'
+
+# Raw 503 for servers that shed load before a request reaches the app
+SERVER_BUSY_HTTP = (
+    b'HTTP/1.1 503 Service Unavailable\r\n'
+    b'Content-Type: application/json\r\n'
+    b'Retry-After: 1\r\n'
+    b'Connection: close\r\n'
+    b'Content-Length: ' + str(len(_SERVER_BUSY)).encode() + b'\r\n\r\n' + _SERVER_BUSY
+)
+
+
+def _error_response(body, status, retry_after):
+    return Response(body, status=status, mimetype='application/json',
+                    headers={'Retry-After': str(retry_after)})
+
+
+class TokenBucketTable:
+    """Thread-safe token buckets keyed by client, evicting least recently used"""
+
+    def __init__(self, max_keys=DEFAULT_MAX_KEYS):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> [tokens, last_refill]
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst, now=None):
+        """Take one token. Returns 0 if allowed, otherwise seconds to wait."""
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [burst, now]
+                if len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0
+            return (1 - bucket[0]) / rate
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+buckets = TokenBucketTable()
+
+
+def client_ip():
+    return request.remote_addr or 'unknown'
+
+
+def _identity(scope):
+    if scope == 'ip':
+        return client_ip()
+    if scope == 'user':
+        # Anonymous callers fall back to their IP
+        user_id = session.get('user_id')
+        return f'user:{user_id}' if user_id else client_ip()
+    raise ValueError(f'Invalid rate limit scope: {scope}')
+
+
+def rate_limit(limit, per=60, burst=None, scope='ip'):
+    """Allow `limit` calls per `per` seconds for each client in `scope` ('ip' or 'user')"""
+    rate = limit / per
+    burst = burst or limit
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            key = (f.__name__, scope, _identity(scope))
+            wait = buckets.take(key, rate, burst)
+            if wait:
+                return _error_response(_TOO_MANY_REQUESTS, 429, math.ceil(wait))
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+def init_load_shedding(app, max_concurrent=DEFAULT_MAX_CONCURRENT):
+    """Reject requests with 503 once `max_concurrent` are already in flight.
+
+    This guards servers that spawn a thread per request (e.g. the development
+    server). serve.py sheds load itself, before requests are queued.
+    """
+    slots = threading.BoundedSemaphore(max_concurrent)
+
+    @app.before_request
+    def acquire_slot():
+        if not slots.acquire(blocking=False):
+            return _error_response(_SERVER_BUSY, 503, 1)
+        g.holds_request_slot = True
+
+    @app.teardown_request
+    def release_slot(exc=None):
+        if g.pop('holds_request_slot', False):
+            slots.release()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# Production launcher
+#
+# Preloads the app once, then serves it from a fixed-size thread pool in one
+# or more pre-forked processes. Cold start (imports, app creation, seed data
+# and a warm-up request) is measured against COLD_START_BUDGET_MS.
+import time
+
+_started = time.perf_counter()
+
+import argparse
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from app import create_app
+from rate_limit import SERVER_BUSY_HTTP
+
+
+def request_handler(timeout):
+    """Request handler class whose socket reads time out after `timeout` seconds"""
+    return type('TimeoutRequestHandler', (WSGIRequestHandler,), {'timeout': timeout})
+
+
+class ThreadPoolWSGIServer(BaseWSGIServer):
+    """WSGI server handling requests on a bounded pool of worker threads.
+
+    At most `max_in_flight` connections are admitted (running plus queued);
+    any more are answered with 503 on the socket, without touching the app.
+    Reads time out after `request_timeout` seconds, so idle or slow clients
+    cannot hold a worker thread (and an admission slot) indefinitely.
+    """
+
+    multithread = True
+
+    def __init__(self, host, port, app, threads, max_in_flight, processes=1, request_timeout=10):
+        if max_in_flight < threads:
+            raise ValueError(f'MAX_CONCURRENT_REQUESTS ({max_in_flight}) must be at least '
+                             f'the thread count ({threads})')
+        super().__init__(host, port, app, handler=request_handler(request_timeout))
+        self.threads = threads
+        self.multiprocess = processes > 1
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._pool = None
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            self._reject(request)
+            return
+        if self._pool is None:
+            # Created lazily so each forked process gets its own threads
+            self._pool = ThreadPoolExecutor(self.threads, thread_name_prefix='wsgi')
+        self._pool.submit(self._handle, request, client_address)
+
+    def _reject(self, request):
+        try:
+            request.settimeout(1)
+            request.sendall(SERVER_BUSY_HTTP)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+        super().server_close()
+
+
+def warm_up(app):
+    """Serve one request in-process so first real requests don't pay for it"""
+    with app.test_client() as client:
+        client.get('/api/stats')
+
+
+def exit_on_sigterm():
+    """Turn SIGTERM into SystemExit so cleanup (atexit, finally) still runs"""
+    def handler(signum, frame):
+        sys.exit(0)
+    signal.signal(signal.SIGTERM, handler)
+
+
+def supervise(server, processes):
+    """Fork `processes` workers sharing the bound socket and wait on them.
+
+    SIGTERM/SIGINT are forwarded to the workers. If any worker exits, the
+    rest are stopped too so the process manager sees the failure.
+    """
+    workers = []
+    for _ in range(processes):
+        pid = os.fork()
+        if pid == 0:
+            # os._exit() skips atexit, so workers remove their archive themselves
+            exit_on_sigterm()
+            try:
+                server.serve_forever()
+            finally:
+                server.app.extensions['donation_platform']['request_archive'].remove()
+                os._exit(0)
+        workers.append(pid)
+
+    stopping = []
+
+    def stop_workers(signum, frame=None):
+        stopping.append(signum)
+        for pid in workers:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop_workers)
+    signal.signal(signal.SIGINT, stop_workers)
+
+    exit_code = 0
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        workers.remove(pid)
+        if not stopping:
+            print(f"Worker {pid} exited unexpectedly, stopping the others")
+            exit_code = 1
+            stop_workers(signal.SIGTERM)
+    server.server_close()
+    return exit_code
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Run the donation platform in production mode')
+    parser.add_argument('--config', default=os.environ.get('FLASK_CONFIG', 'production'))
+    parser.add_argument('--host')
+    parser.add_argument('--port', type=int)
+    parser.add_argument('--threads', type=int)
+    parser.add_argument('--processes', type=int)
+    parser.add_argument('--strict', action='store_true',
+                        help='exit with an error if cold start exceeds the budget')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        app = create_app(args.config)
+    except (RuntimeError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    warm_up(app)
+
+    host = args.host or app.config['SERVER_HOST']
+    port = args.port or app.config['SERVER_PORT']
+    threads = args.threads or app.config['SERVER_THREADS']
+    processes = args.processes or app.config['SERVER_PROCESSES']
+
+    cold_start_ms = (time.perf_counter() - _started) * 1000
+    budget_ms = app.config['COLD_START_BUDGET_MS']
+    print(f"Cold start: {cold_start_ms:.0f} ms (budget {budget_ms} ms)")
+    if cold_start_ms > budget_ms:
+        print(f"WARNING: cold start exceeded budget by {cold_start_ms - budget_ms:.0f} ms")
+        if args.strict:
+            sys.exit(1)
+
+    if processes > 1 and not hasattr(os, 'fork'):
+        print("WARNING: multiple processes need os.fork(), falling back to 1")
+        processes = 1
+    if processes > 1:
+        # Storage is in-memory, so every process has its own copy of the data
+        print("WARNING: in-memory data is not shared between processes")
+
+    max_in_flight = app.config['MAX_CONCURRENT_REQUESTS']
+    try:
+        server = ThreadPoolWSGIServer(host, port, app, threads, max_in_flight, processes,
+                                      request_timeout=app.config['SERVER_REQUEST_TIMEOUT'])
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    print(f"Serving on http://{host}:{port} with {processes} process(es) x {threads} thread(s), "
+          f"at most {max_in_flight} request(s) in flight per process")
+
+    if processes == 1:
+        exit_on_sigterm()
+        server.serve_forever()
+    else:
+        # The listening socket is bound before forking, so all workers accept on it
+        sys.exit(supervise(server, processes))
+
+
+if __name__ == '__main__':
+    main()